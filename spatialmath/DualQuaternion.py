@@ -1,12 +1,275 @@
 from __future__ import annotations
+from importlib.util import find_spec
+import math
 import numpy as np
 from spatialmath import Quaternion, UnitQuaternion
 from spatialmath import base
 import spatialmath.pose3d as pose3d
-from spatialmath.base.types import ArrayLike3, R8x8, R8
+from spatialmath.base.types import ArrayLike3, R3, R8x8, R8
+from numpy.typing import DTypeLike
+
+# numba is optional, and slow to import, so it is only imported when the first
+# multi-valued product is computed
+_numba = find_spec("numba") is not None
 
 # TODO scalar multiplication
 
+# supported storage types
+_DTYPES = (np.dtype(np.float64), np.dtype(np.float32))
+
+
+def _getdtype(dtype: DTypeLike) -> np.dtype:
+    # storage type from a constructor dtype argument
+    dtype = np.dtype(dtype)
+    if dtype not in _DTYPES:
+        raise ValueError("dtype must be float32 or float64")
+    return dtype
+
+
+# sign mask that negates the vector parts of both quaternions
+_CONJ_MASK = np.array([1.0, -1.0, -1.0, -1.0, 1.0, -1.0, -1.0, -1.0])
+
+
+# index and sign tables that map a quaternion to its left-multiplication
+# matrix, see :func:`~spatialmath.base.quaternions.qmatrix`
+_QMAT_INDEX = np.array([[0, 1, 2, 3], [1, 0, 3, 2], [2, 3, 0, 1], [3, 2, 1, 0]])
+_QMAT_SIGN = np.array(
+    [
+        [1, -1, -1, -1],
+        [1, 1, -1, 1],
+        [1, 1, 1, -1],
+        [1, -1, 1, 1],
+    ],
+    dtype=np.int8,  # so that the product keeps the dtype of the quaternion
+)
+
+# the same Hamilton product as a dense tensor, the product of quaternions a
+# and b is sum_jk _H_SIGN[i,j,k] a[j] b[k].  This is the quicker form for a
+# few quaternions while the sparse index/sign tables above win for batches
+_H_SIGN = np.zeros((4, 4, 4), dtype=np.int8)
+_H_SIGN[np.arange(4)[:, np.newaxis], _QMAT_INDEX, np.arange(4)] = _QMAT_SIGN
+_QQMUL_DENSE_MAX = 24  # number of quaternions
+
+
+def _qmatrix(q: np.ndarray) -> np.ndarray:
+    # left-multiplication matrices, shape (...,4,4), of a quaternion array of
+    # shape (...,4)
+    return q[..., _QMAT_INDEX] * _QMAT_SIGN
+
+
+def _qqmul(q1: np.ndarray, q2: np.ndarray) -> np.ndarray:
+    # Hamilton product of quaternion arrays of shape (...,4), broadcasts over
+    # the leading dimensions
+    if max(q1.size, q2.size) <= 4 * _QQMUL_DENSE_MAX:
+        return np.einsum("ijk,...j,...k->...i", _H_SIGN, q1, q2)
+    return np.einsum("...ij,...j->...i", _qmatrix(q1), q2)
+
+
+def _dqmul_batch(A: np.ndarray, B: np.ndarray, O: np.ndarray) -> None:
+    # product of dual quaternion arrays of shape (N,8) written into O, the two
+    # Hamilton products of each pair are expanded inline.  Compiled with numba
+    # by _dqmul_jit.
+    for i in _prange(A.shape[0]):
+        a0, a1, a2, a3, a4, a5, a6, a7 = A[i, 0:8]
+        b0, b1, b2, b3, b4, b5, b6, b7 = B[i, 0:8]
+
+        # real part: ar * br
+        O[i, 0] = a0 * b0 - a1 * b1 - a2 * b2 - a3 * b3
+        O[i, 1] = a0 * b1 + a1 * b0 + a2 * b3 - a3 * b2
+        O[i, 2] = a0 * b2 - a1 * b3 + a2 * b0 + a3 * b1
+        O[i, 3] = a0 * b3 + a1 * b2 - a2 * b1 + a3 * b0
+
+        # dual part: ar * bd + ad * br
+        O[i, 4] = (a0 * b4 - a1 * b5 - a2 * b6 - a3 * b7) + (
+            a4 * b0 - a5 * b1 - a6 * b2 - a7 * b3
+        )
+        O[i, 5] = (a0 * b5 + a1 * b4 + a2 * b7 - a3 * b6) + (
+            a4 * b1 + a5 * b0 + a6 * b3 - a7 * b2
+        )
+        O[i, 6] = (a0 * b6 - a1 * b7 + a2 * b4 + a3 * b5) + (
+            a4 * b2 - a5 * b3 + a6 * b0 + a7 * b1
+        )
+        O[i, 7] = (a0 * b7 + a1 * b6 - a2 * b5 + a3 * b4) + (
+            a4 * b3 + a5 * b2 - a6 * b1 + a7 * b0
+        )
+
+
+_prange = range
+_dqmul_batch_jit = None
+
+
+def _dqmul_jit():
+    # compile _dqmul_batch with numba on first use.  An installed numba may
+    # still fail to import, eg. if it does not support the installed NumPy, in
+    # which case it is not tried again and None is returned
+    global _numba, _prange, _dqmul_batch_jit
+    if _dqmul_batch_jit is None:
+        try:
+            import numba
+        except ImportError:
+            _numba = False
+            return None
+
+        _prange = numba.prange
+        _dqmul_batch_jit = numba.njit(parallel=True, fastmath=True, cache=True)(
+            _dqmul_batch
+        )
+    return _dqmul_batch_jit
+
+
+# below this many values the einsum product is quicker than _dqmul_soa
+_DQMUL_SOA_MIN = 500
+
+
+def _dqmul_expanded(a, b) -> tuple:
+    # the eight components of the product of dual quaternions a and b, each
+    # given as a sequence of eight components.  The components may be floats
+    # or NumPy arrays, in which case the products are computed element-wise.
+    a0, a1, a2, a3, a4, a5, a6, a7 = a
+    b0, b1, b2, b3, b4, b5, b6, b7 = b
+    return (
+        # real part: ar * br
+        a0 * b0 - a1 * b1 - a2 * b2 - a3 * b3,
+        a0 * b1 + a1 * b0 + a2 * b3 - a3 * b2,
+        a0 * b2 - a1 * b3 + a2 * b0 + a3 * b1,
+        a0 * b3 + a1 * b2 - a2 * b1 + a3 * b0,
+        # dual part: ar * bd + ad * br
+        (a0 * b4 - a1 * b5 - a2 * b6 - a3 * b7)
+        + (a4 * b0 - a5 * b1 - a6 * b2 - a7 * b3),
+        (a0 * b5 + a1 * b4 + a2 * b7 - a3 * b6)
+        + (a4 * b1 + a5 * b0 + a6 * b3 - a7 * b2),
+        (a0 * b6 - a1 * b7 + a2 * b4 + a3 * b5)
+        + (a4 * b2 - a5 * b3 + a6 * b0 + a7 * b1),
+        (a0 * b7 + a1 * b6 - a2 * b5 + a3 * b4)
+        + (a4 * b3 + a5 * b2 - a6 * b1 + a7 * b0),
+    )
+
+
+def _dqmul_soa(A: np.ndarray, B: np.ndarray) -> np.ndarray:
+    # product of dual quaternion arrays of shape (N,8).  The operands are
+    # transposed so that each component is a contiguous row of length N, the
+    # products are then computed component-wise across all N values at once
+    # by vectorized NumPy loops, and the result is transposed back.
+    O = np.array(
+        _dqmul_expanded(np.ascontiguousarray(A.T), np.ascontiguousarray(B.T)),
+        dtype=np.result_type(A, B),
+    )
+    return np.ascontiguousarray(O.T)
+
+
+def _dqmul(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    # product of dual quaternion arrays of shape (...,8), broadcasts over the
+    # leading dimensions
+    if a.ndim == 1 and b.ndim == 1:
+        # single values, expanded on Python floats is quickest
+        return np.array(
+            _dqmul_expanded(a.tolist(), b.tolist()), dtype=np.result_type(a, b)
+        )
+    elif a.ndim == 2 and a.shape == b.shape:
+        kernel = _dqmul_jit() if _numba else None
+        if kernel is not None:
+            out = np.empty(a.shape, dtype=np.result_type(a, b))
+            kernel(a, b, out)
+            return out
+        elif a.shape[0] >= _DQMUL_SOA_MIN:
+            return _dqmul_soa(a, b)
+
+    Lr = _qmatrix(a[..., :4])
+    Ld = _qmatrix(a[..., 4:])
+    br, bd = b[..., :4], b[..., 4:]
+    return np.concatenate(
+        (
+            np.einsum("...ij,...j->...i", Lr, br),
+            np.einsum("...ij,...j->...i", Lr, bd)
+            + np.einsum("...ij,...j->...i", Ld, br),
+        ),
+        axis=-1,
+    )
+
+
+def _dqmul_broadcast(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    # product of dual quaternion arrays of shape (8,) or (N,8) with NumPy
+    # broadcasting, the operands are expanded to a common (N,8) shape so the
+    # whole batch goes through a single call of the batch kernel
+    if a.ndim == 1 and b.ndim == 1:
+        return _dqmul(a, b)
+    a, b = np.broadcast_arrays(a.reshape((-1, 8)), b.reshape((-1, 8)))
+    return _dqmul(np.ascontiguousarray(a), np.ascontiguousarray(b))
+
+
+def _dqunit(a: np.ndarray) -> np.ndarray:
+    # normalize dual quaternion arrays of shape (...,8): the real part is
+    # scaled to unit length and the dual part is made orthogonal to it
+    r = a[..., :4]
+    n = np.linalg.norm(r, axis=-1, keepdims=True)
+    r = r / n
+    d = a[..., 4:] / n
+    d = d - np.sum(r * d, axis=-1, keepdims=True) * r
+    return np.concatenate((r, d), axis=-1)
+
+
+def _q2r(q: np.ndarray) -> np.ndarray:
+    # rotation matrices, shape (...,3,3), from unit quaternions, shape (...,4).
+    # Vectorized form of base.q2r
+    s, x, y, z = np.moveaxis(q, -1, 0)
+    R = np.empty(q.shape[:-1] + (3, 3), dtype=q.dtype)
+    R[..., 0, 0] = 1 - 2 * (y**2 + z**2)
+    R[..., 0, 1] = 2 * (x * y - s * z)
+    R[..., 0, 2] = 2 * (x * z + s * y)
+    R[..., 1, 0] = 2 * (x * y + s * z)
+    R[..., 1, 1] = 1 - 2 * (x**2 + z**2)
+    R[..., 1, 2] = 2 * (y * z - s * x)
+    R[..., 2, 0] = 2 * (x * z - s * y)
+    R[..., 2, 1] = 2 * (y * z + s * x)
+    R[..., 2, 2] = 1 - 2 * (x**2 + y**2)
+    return R
+
+
+def _r2q_batch(R: np.ndarray) -> np.ndarray:
+    # unit quaternions, shape (N,4), from rotation matrices, shape (N,3,3).
+    # Vectorized form of Cayley's method as used by base.r2q
+    R00, R01, R02 = R[:, 0, 0], R[:, 0, 1], R[:, 0, 2]
+    R10, R11, R12 = R[:, 1, 0], R[:, 1, 1], R[:, 1, 2]
+    R20, R21, R22 = R[:, 2, 0], R[:, 2, 1], R[:, 2, 2]
+
+    k1, k2, k3 = R21 - R12, R02 - R20, R10 - R01
+    p12, p13, p23 = R10 + R01, R02 + R20, R21 + R12
+
+    d1 = (R00 + R11 + R22 + 1) ** 2
+    d2 = (R00 - R11 - R22 + 1) ** 2
+    d3 = (-R00 + R11 - R22 + 1) ** 2
+    d4 = (-R00 - R11 + R22 + 1) ** 2
+
+    e = (
+        np.sqrt(
+            np.stack(
+                (
+                    d1 + k1**2 + k2**2 + k3**2,
+                    k1**2 + d2 + p12**2 + p13**2,
+                    k2**2 + p12**2 + d3 + p23**2,
+                    k3**2 + p13**2 + p23**2 + d4,
+                ),
+                axis=-1,
+            )
+        )
+        / 4.0
+    )
+
+    # the signs of the elements are taken from row i of this symmetric matrix
+    # where i is the index of the largest element
+    one = np.ones_like(R00)
+    S = np.stack(
+        (
+            np.stack((one, k1, k2, k3), axis=-1),
+            np.stack((k1, one, p12, p13), axis=-1),
+            np.stack((k2, p12, one, p23), axis=-1),
+            np.stack((k3, p13, p23, one), axis=-1),
+        ),
+        axis=-2,
+    )
+    i = np.argmax(e, axis=-1)
+    return np.copysign(e, S[np.arange(len(i)), i])
+
 
 class DualQuaternion:
     r"""
@@ -20,19 +283,25 @@ class DualQuaternion:
 
     The latter form is used here.
 
+    The value is held as a single NumPy array, shape (8,) for a single dual
+    quaternion or shape (N,8) for ``N`` values, with the real quaternion in
+    the first four columns and the dual quaternion in the last four.  The
+    array is float64 by default, float32 can be chosen to halve the memory
+    and bandwidth needed by large batches.
+
     :References:
 
     - http://web.cs.iastate.edu/~cs577/handouts/dual-quaternion.pdf
     - https://en.wikipedia.org/wiki/Dual_quaternion
 
-    .. warning:: Unlike the other spatial math classes, this class does not
-      (yet) support multiple values per object.
-
     :seealso: :func:`UnitDualQuaternion`
     """
 
     def __init__(
-        self, real: Quaternion | None = None, dual: Quaternion | None = None
+        self,
+        real: Quaternion | None = None,
+        dual: Quaternion | None = None,
+        dtype: DTypeLike = np.float64,
     ) -> None:
         """
         Construct a new dual quaternion
@@ -41,6 +310,9 @@ class DualQuaternion:
         :type real: Quaternion or UnitQuaternion
         :param dual: dual quaternion
         :type dual: Quaternion or UnitQuaternion
+        :param dtype: element type of the internal storage, float32 or float64
+            [default]
+        :type dtype: numpy dtype
         :raises ValueError: incorrect parameters
 
         Example:
@@ -48,37 +320,124 @@ class DualQuaternion:
         .. runblock:: pycon
 
             >>> from spatialmath import DualQuaternion, Quaternion
+            >>> import numpy as np
             >>> d = DualQuaternion(Quaternion([1,2,3,4]), Quaternion([5,6,7,8]))
             >>> print(d)
             >>> d = DualQuaternion([1, 2, 3, 4,  5, 6, 7, 8])
             >>> print(d)
+            >>> d = DualQuaternion(np.random.rand(3, 8))
+            >>> len(d)
+
+        - ``DualQuaternion()`` is a zero dual quaternion
+        - ``DualQuaternion(real, dual)`` is a dual quaternion with real and
+          dual parts given as ``Quaternion`` instances
+        - ``DualQuaternion(v)`` is a dual quaternion from the 8-vector ``v``
+        - ``DualQuaternion(A)`` is a dual quaternion with ``N`` values given by
+          the rows of the array ``A`` with shape (N,8)
+
+        The dual number is stored internally as a NumPy array whose first and
+        last four elements are respectively the ``real`` and ``dual``
+        quaternions.
 
-        The dual number is stored internally as two quaternion, respectively
-        called ``real`` and ``dual``.
+        .. note:: Operations keep the dtype of their operands.  float32 gives
+            about 7 significant digits, an angular resolution better than
+            0.01° which is adequate for most pose work, but errors accumulate
+            faster over long chains of products.
 
         """
+        dtype = _getdtype(dtype)
 
         if real is None and dual is None:
-            self.real = None
-            self.dual = None
-            return
+            self._a = np.zeros((8,), dtype=dtype)
         elif dual is None and base.isvector(real, 8):
-            self.real = Quaternion(real[0:4])
-            self.dual = Quaternion(real[4:8])
+            self._a = np.array(base.getvector(real, 8), dtype=dtype)
+        elif dual is None and isinstance(real, np.ndarray) and real.shape[-1:] == (8,):
+            if real.ndim != 2:
+                raise ValueError("array of dual quaternions must have shape (N,8)")
+            self._a = np.array(real, dtype=dtype)
         elif real is not None and dual is not None:
             if not isinstance(real, Quaternion):
                 raise ValueError("real part must be a Quaternion subclass")
             if not isinstance(dual, Quaternion):
-                raise ValueError("real part must be a Quaternion subclass")
-            self.real = real  # quaternion, real part
-            self.dual = dual  # quaternion, dual part
+                raise ValueError("dual part must be a Quaternion subclass")
+            self._a = np.concatenate((real.vec, dual.vec), axis=-1, dtype=dtype)
         else:
             raise ValueError("expecting zero or two parameters")
 
+    @classmethod
+    def _from_array(cls, a: np.ndarray) -> DualQuaternion:
+        # wrap an existing (8,) or (N,8) array without any checking or copying
+        dq = cls.__new__(cls)
+        dq._a = a
+        return dq
+
     @classmethod
     def Pure(cls, x: ArrayLike3) -> DualQuaternion:
         x = base.getvector(x, 3)
-        return cls(UnitQuaternion(), Quaternion.Pure(x))
+        return cls._from_array(np.r_[1.0, 0, 0, 0, 0, x])
+
+    @property
+    def real(self) -> Quaternion:
+        """
+        Real part of dual quaternion
+
+        :return: real part
+        :rtype: Quaternion
+
+        .. note:: A new ``Quaternion`` instance is created on every access.
+        """
+        if self._a.ndim == 1:
+            return Quaternion(self._a[:4])
+        else:
+            return Quaternion(list(self._a[:, :4]))
+
+    @property
+    def dual(self) -> Quaternion:
+        """
+        Dual part of dual quaternion
+
+        :return: dual part
+        :rtype: Quaternion
+
+        .. note:: A new ``Quaternion`` instance is created on every access.
+        """
+        if self._a.ndim == 1:
+            return Quaternion(self._a[4:])
+        else:
+            return Quaternion(list(self._a[:, 4:]))
+
+    def __len__(self) -> int:
+        """
+        Number of values in dual quaternion
+
+        :return: number of values
+        :rtype: int
+        """
+        return 1 if self._a.ndim == 1 else self._a.shape[0]
+
+    def __getitem__(self, i: int | slice) -> DualQuaternion:
+        """
+        Index into a multi-valued dual quaternion
+
+        :param i: index or slice
+        :type i: int or slice
+        :return: dual quaternion value(s)
+        :rtype: DualQuaternion
+
+        The result is a copy, it does not share storage with this dual
+        quaternion.
+        """
+        a = self._a
+        if a.ndim == 1:
+            if isinstance(i, slice):
+                # treat as a single row, keep a single value if it is selected
+                a = a[np.newaxis][i]
+                if len(a) == 1:
+                    a = a[0]
+            elif i not in (0, -1):
+                raise IndexError("index out of range")
+            return self._from_array(a.copy())
+        return self._from_array(a[i].copy())
 
     def __repr__(self) -> str:
         return str(self)
@@ -98,17 +457,32 @@ class DualQuaternion:
             >>> d = DualQuaternion(Quaternion([1,2,3,4]), Quaternion([5,6,7,8]))
             >>> str(d)
         """
-        return str(self.real) + " + ε " + str(self.dual)
+        if isinstance(self, UnitDualQuaternion):
+            delim = ("<<", ">>")
+        else:
+            delim = ("<", ">")
+        return "\n".join(
+            [
+                base.qprint(a[:4], file=None, delim=delim)
+                + " + ε "
+                + base.qprint(a[4:], file=None)
+                for a in self._a.reshape((-1, 8))
+            ]
+        )
 
     def norm(self) -> tuple[float, float]:
-        """
+        r"""
         Norm of a dual quaternion
 
         :return: Norm as a dual number
         :rtype: 2-tuple
 
-        The norm of a ``UnitDualQuaternion`` is unity, represented by the dual
-        number (1,0).
+        The norm is the dual number square root of :math:`q q^*`, whose real
+        and dual parts are :math:`a = r \cdot r` and :math:`b = 2 r \cdot d`,
+        and is :math:`(\sqrt{a}, b / 2\sqrt{a})`.  The norm of a
+        ``UnitDualQuaternion`` is unity, represented by the dual number (1,0).
+        If the dual quaternion has ``N`` values the parts are arrays of shape
+        (N,).
 
         Example:
 
@@ -118,9 +492,21 @@ class DualQuaternion:
             >>> d = DualQuaternion(Quaternion([1,2,3,4]), Quaternion([5,6,7,8]))
             >>> d.norm()  # norm is a dual number
         """
-        a = self.real * self.real.conj()
-        b = self.real * self.dual.conj() + self.dual * self.real.conj()
-        return (base.sqrt(a.s), base.sqrt(b.s))
+        # scalar parts of r r* and r d* + d r* are the dot products a = r.r
+        # and b = 2 r.d, b is zero when a is
+        r = self._a[..., :4]
+        d = self._a[..., 4:]
+        if r.ndim == 1:
+            a = float(r @ r)
+            if a == 0:
+                return (0.0, 0.0)
+            n = math.sqrt(a)
+            return (n, float(r @ d) / n)
+        else:
+            a = np.einsum("ij,ij->i", r, r)
+            b = np.einsum("ij,ij->i", r, d)
+            n = np.sqrt(a)
+            return (n, np.divide(b, n, out=np.zeros_like(b), where=n != 0))
 
     def conj(self) -> DualQuaternion:
         r"""
@@ -141,7 +527,8 @@ class DualQuaternion:
             >>> d = DualQuaternion(Quaternion([1,2,3,4]), Quaternion([5,6,7,8]))
             >>> d.conj()
         """
-        return DualQuaternion(self.real.conj(), self.dual.conj())
+        a = self._a
+        return DualQuaternion._from_array(np.multiply(a, _CONJ_MASK, dtype=a.dtype))
 
     def __add__(self: DualQuaternion, right: DualQuaternion) -> DualQuaternion:
         """
@@ -158,10 +545,7 @@ class DualQuaternion:
             >>> d = DualQuaternion(Quaternion([1,2,3,4]), Quaternion([5,6,7,8]))
             >>> d + d
         """
-        assert self.real is not None and self.dual is not None
-        assert right.real is not None and right.dual is not None
-
-        return DualQuaternion(self.real + right.real, self.dual + right.dual)
+        return DualQuaternion._from_array(self._a + right._a)
 
     def __sub__(self, right: DualQuaternion) -> DualQuaternion:
         """
@@ -178,20 +562,19 @@ class DualQuaternion:
             >>> d = DualQuaternion(Quaternion([1,2,3,4]), Quaternion([5,6,7,8]))
             >>> d - d
         """
-        assert self.real is not None and self.dual is not None
-        assert right.real is not None and right.dual is not None
-
-        return DualQuaternion(self.real - right.real, self.dual - right.dual)
+        return DualQuaternion._from_array(self._a - right._a)
 
     def __mul__(self: DualQuaternion, right: DualQuaternion) -> DualQuaternion:
         """
         Product of dual quaternion
 
-        - ``dq1 * dq2`` is a dual quaternion representing the product of
-          ``dq1`` and ``dq2``.  If both are unit dual quaternions, the product
-          will be a unit dual quaternion.
-        - ``dq * p`` transforms the point ``p`` (3) by the unit dual quaternion
-          ``dq``.
+        ``dq1 * dq2`` is a dual quaternion representing the product of ``dq1``
+        and ``dq2``.
+
+        If both operands have ``N`` values the result has ``N`` values formed
+        by the element-wise products.  When `Numba <https://numba.pydata.org>`_
+        is installed this product is computed by a compiled kernel, otherwise
+        large batches are computed component-wise across all values.
 
         Example:
 
@@ -200,35 +583,64 @@ class DualQuaternion:
             >>> from spatialmath import DualQuaternion, Quaternion
             >>> d = DualQuaternion(Quaternion([1,2,3,4]), Quaternion([5,6,7,8]))
             >>> d * d
-        """
-        assert self.real is not None and self.dual is not None
-        assert right.real is not None and right.dual is not None
 
+        :seealso: :meth:`UnitDualQuaternion.__mul__`
+        """
         if isinstance(right, DualQuaternion):
-            real = self.real * right.real
-            dual = self.real * right.dual + self.dual * right.real
+            return DualQuaternion._from_array(_dqmul(self._a, right._a))
+        else:
+            raise ValueError("operands to * are of different types")
 
-            if isinstance(self, UnitDualQuaternion) and isinstance(
-                self, UnitDualQuaternion
-            ):
-                return UnitDualQuaternion(real, dual)
-            else:
-                return DualQuaternion(real, dual)
+    def __matmul__(self, right: DualQuaternion) -> DualQuaternion:
+        """
+        Batched product of dual quaternion
+
+        ``dq1 @ dq2`` is a dual quaternion representing the product of ``dq1``
+        and ``dq2``, where the values of the operands are broadcast against
+        each other following NumPy rules.
+
+        ====  =====  ====================================
+        dq1   dq2    result
+        ====  =====  ====================================
+        1     1      ``dq1 * dq2``
+        N     1      ``dq1[i] * dq2``
+        1     N      ``dq1 * dq2[i]``
+        N     N      ``dq1[i] * dq2[i]``
+        ====  =====  ====================================
+
+        .. note:: ``*`` gives the same values.  The difference is that ``@``
+            expands a single-valued operand to ``N`` values so the whole
+            batch is always composed by one call of the batch kernel, while
+            ``*`` combines single and multi-valued operands through the
+            slower product-matrix path.  For unit dual quaternions ``@`` also
+            normalizes the product, see :meth:`UnitDualQuaternion.__matmul__`.
+
+        Example:
 
-        elif isinstance(self, UnitDualQuaternion) and base.isvector(right, 3):
-            v = base.getvector(right, 3)
-            vp = self * DualQuaternion.Pure(v) * self.conj()
-            return vp.dual.v
+        .. runblock:: pycon
+
+            >>> from spatialmath import DualQuaternion
+            >>> import numpy as np
+            >>> d = DualQuaternion(np.arange(16).reshape(2, 8))
+            >>> d @ d[0]
+
+        :seealso: :meth:`__mul__` :meth:`UnitDualQuaternion.__matmul__`
+        """
+        if isinstance(right, DualQuaternion):
+            return DualQuaternion._from_array(_dqmul_broadcast(self._a, right._a))
+        else:
+            raise ValueError("operands to @ are of different types")
 
     def matrix(self) -> R8x8:
         """
         Dual quaternion as a matrix
 
         :return: Matrix represensation
-        :rtype: ndarray(8,8)
+        :rtype: ndarray(8,8) or ndarray(N,8,8)
 
         Dual quaternion multiplication can also be written as a matrix-vector
-        product.
+        product.  If the dual quaternion has ``N`` values the result is a
+        stack of ``N`` matrices.
 
         Example:
 
@@ -240,11 +652,14 @@ class DualQuaternion:
             >>> d.matrix() @ d.vec
             >>> d * d
         """
-        assert self.real is not None and self.dual is not None
-
-        return np.block(
-            [[self.real.matrix, np.zeros((4, 4))], [self.dual.matrix, self.real.matrix]]
-        )
+        a = self._a
+        Mr = _qmatrix(a[..., :4])
+        M = np.empty(a.shape[:-1] + (8, 8), dtype=a.dtype)
+        M[..., :4, :4] = Mr
+        M[..., :4, 4:] = 0
+        M[..., 4:, :4] = _qmatrix(a[..., 4:])
+        M[..., 4:, 4:] = Mr
+        return M
 
     @property
     def vec(self) -> R8:
@@ -252,7 +667,12 @@ class DualQuaternion:
         Dual quaternion as a vector
 
         :return: Vector represensation
-        :rtype: ndarray(8)
+        :rtype: ndarray(8) or ndarray(N,8)
+
+        ``d.vec`` is the dual quaternion as a vector.  If `len(d)` is:
+
+            - 1, return a NumPy array shape=(8,)
+            - N>1, return a NumPy array shape=(N,8).
 
         Example:
 
@@ -261,10 +681,10 @@ class DualQuaternion:
             >>> from spatialmath import DualQuaternion, Quaternion
             >>> d = DualQuaternion(Quaternion([1,2,3,4]), Quaternion([5,6,7,8]))
             >>> d.vec
-        """
-        assert self.real is not None and self.dual is not None
 
-        return np.r_[self.real.vec, self.dual.vec]
+        .. note:: The internal storage is returned, not a copy.
+        """
+        return self._a
 
 
 class UnitDualQuaternion(DualQuaternion):
@@ -274,14 +694,14 @@ class UnitDualQuaternion(DualQuaternion):
     :type DualQuaternion: [type]
 
 
-    .. warning:: Unlike the other spatial math classes, this class does not
-      (yet) support multiple values per object.
-
     :seealso: :func:`UnitDualQuaternion`
     """
 
     def __init__(
-        self, real: Quaternion | None = None, dual: Quaternion | None = None
+        self,
+        real: Quaternion | None = None,
+        dual: Quaternion | None = None,
+        dtype: DTypeLike = np.float64,
     ) -> None:
         r"""
         Create new unit dual quaternion
@@ -290,6 +710,10 @@ class UnitDualQuaternion(DualQuaternion):
         :type real: Quaternion, UnitQuaternion or SE3
         :param dual: dual quaternion
         :type dual: Quaternion or UnitQuaternion
+        :param dtype: element type of the internal storage, float32 or float64
+            [default]
+        :type dtype: numpy dtype
+        :raises ValueError: incorrect parameters
 
         - ``UnitDualQuaternion(real, dual)`` is a new unit dual quaternion with
           real and dual parts as specified.
@@ -307,9 +731,9 @@ class UnitDualQuaternion(DualQuaternion):
             >>> print(d)
             >>> type(d)
 
-        The dual number is stored internally as two quaternion, respectively
-        called ``real`` and ``dual``.  For a unit dual quaternion they are
-        respectively:
+        The dual number is stored internally as a NumPy array whose first and
+        last four elements are respectively the ``real`` and ``dual``
+        quaternions.  For a unit dual quaternion they are respectively:
 
         .. math::
 
@@ -321,16 +745,179 @@ class UnitDualQuaternion(DualQuaternion):
         and :math:`q_t` is a pure quaternion formed from the translational part
         :math:`t`.
         """
+        dtype = _getdtype(dtype)
 
-        if dual is None and isinstance(real, pose3d.SE3):
+        if real is None and dual is None:
+            self._a = np.array([1.0, 0, 0, 0, 0, 0, 0, 0], dtype=dtype)
+        elif dual is None and isinstance(real, pose3d.SE3):
             T = real
-            S = UnitQuaternion(T.R)
-            D = Quaternion.Pure(T.t)
+            if len(T) == 1:
+                S = base.r2q(T.R)
+                D = base.qpure(T.t)
+
+                self._a = np.r_[S, 0.5 * _qqmul(D, S)].astype(dtype, copy=False)
+            else:
+                self._a = UnitDualQuaternion.FromSE3(T, dtype=dtype)._a
+        else:
+            super().__init__(real, dual, dtype=dtype)
+
+    @property
+    def real(self) -> UnitQuaternion:
+        """
+        Real part of unit dual quaternion
+
+        :return: real part
+        :rtype: UnitQuaternion
+
+        The real part of a unit dual quaternion is a unit quaternion
+        representing the rotation.
+
+        .. note:: A new ``UnitQuaternion`` instance is created on every
+            access.
+        """
+        if self._a.ndim == 1:
+            return UnitQuaternion(self._a[:4], norm=False, check=False)
+        else:
+            return UnitQuaternion(list(self._a[:, :4]), norm=False, check=False)
+
+    @classmethod
+    def FromSE3(
+        cls, T: pose3d.SE3 | np.ndarray, dtype: DTypeLike = np.float64
+    ) -> UnitDualQuaternion:
+        r"""
+        Construct unit dual quaternion from SE(3) matrices
+
+        :param T: rigid-body motions
+        :type T: SE3, ndarray(4,4) or ndarray(N,4,4)
+        :param dtype: element type of the internal storage, float32 or float64
+            [default]
+        :type dtype: numpy dtype
+        :return: unit dual quaternion with one value per rigid-body motion
+        :rtype: UnitDualQuaternion
+        :raises ValueError: dtype is not float32 or float64
+
+        ``UnitDualQuaternion.FromSE3(T)`` is a unit dual quaternion equivalent
+        to the rigid-body motions ``T``, an ``SE3`` instance or an array of
+        SE(3) matrices.  All values are converted at once, without
+        constructing intermediate quaternion objects.
+
+        Example:
+
+        .. runblock:: pycon
+
+            >>> from spatialmath import UnitDualQuaternion, SE3
+            >>> T = SE3.Rand(N=5)
+            >>> d = UnitDualQuaternion.FromSE3(T)
+            >>> len(d)
+
+        .. note:: There is no check that the matrices are valid SE(3).
+
+        :seealso: :meth:`SE3`
+        """
+        dtype = _getdtype(dtype)
+        if isinstance(T, pose3d.SE3):
+            T = T.A
+        A = np.asarray(T, dtype=np.float64)
+        single = A.ndim == 2
+        A = A.reshape((-1, 4, 4))
 
-            real = S
-            dual = 0.5 * D * S
+        S = _r2q_batch(A[:, :3, :3])
+        D = np.zeros((A.shape[0], 4))
+        D[:, 1:] = A[:, :3, 3]
 
-        super().__init__(real, dual)
+        a = np.concatenate((S, 0.5 * _qqmul(D, S)), axis=-1, dtype=dtype)
+        return cls._from_array(a[0] if single else a)
+
+    def __mul__(self, right: DualQuaternion | ArrayLike3) -> DualQuaternion | R3:
+        r"""
+        Product of unit dual quaternion
+
+        - ``dq1 * dq2`` is a dual quaternion representing the product of
+          ``dq1`` and ``dq2``.  If both are unit dual quaternions, the product
+          will be a unit dual quaternion.
+        - ``dq * p`` transforms the point ``p`` (3) by the unit dual quaternion
+          ``dq``.  If ``dq`` has ``N`` values the result is a 3xN array whose
+          columns are the point transformed by each value.
+        - ``dq * P`` transforms the points ``P``, a 3xN array of column
+          vectors, by the single valued unit dual quaternion ``dq``.
+
+        Points are transformed as :math:`\mat{R} p + t` using the rotation
+        and translation encoded in ``dq``, which is equivalent to but much
+        cheaper than the dual quaternion product :math:`q p \bar{q}^*`.
+
+        Example:
+
+        .. runblock:: pycon
+
+            >>> from spatialmath import UnitDualQuaternion, SE3
+            >>> d = UnitDualQuaternion(SE3.Rx(0.3))
+            >>> d * d
+            >>> d * [1, 2, 3]
+
+        :seealso: :meth:`DualQuaternion.__mul__`
+        """
+        if isinstance(right, UnitDualQuaternion):
+            return UnitDualQuaternion._from_array(_dqmul(self._a, right._a))
+        elif isinstance(right, DualQuaternion):
+            return DualQuaternion._from_array(_dqmul(self._a, right._a))
+        elif isinstance(right, (list, tuple, np.ndarray)):
+            # points are converted to the storage dtype of this dual quaternion
+            R, t = self._Rt()
+            if (
+                R.ndim == 2
+                and isinstance(right, np.ndarray)
+                and right.ndim == 2
+                and right.shape[0] == 3
+            ):
+                # 3xN points, including a single column, as for SE3
+                return R @ right.astype(R.dtype, copy=False) + t[:, np.newaxis]
+            elif base.isvector(right, 3):
+                v = base.getvector(right, 3, dtype=R.dtype)
+                if R.ndim == 2:
+                    return R @ v + t
+                else:
+                    return (R @ v + t).T
+            else:
+                raise ValueError("bad operands")
+        else:
+            raise ValueError("operands to * are of different types")
+
+    def __matmul__(self, right: DualQuaternion) -> DualQuaternion:
+        """
+        Batched product of unit dual quaternion
+
+        ``dq1 @ dq2`` is the product of ``dq1`` and ``dq2``, broadcast as for
+        :meth:`DualQuaternion.__matmul__`.  If both are unit dual quaternions
+        the product is followed by explicit normalization and the result is a
+        unit dual quaternion.
+
+        .. note:: This operator is functionally equivalent to ``*`` but is
+            more costly.  It is useful for cases where a pose is incrementally
+            updated over many cycles.
+
+        Example:
+
+        .. runblock:: pycon
+
+            >>> from spatialmath import UnitDualQuaternion, SE3
+            >>> d = UnitDualQuaternion(SE3.Rx([0.1, 0.2, 0.3]))
+            >>> d @ UnitDualQuaternion(SE3.Tx(1))
+
+        :seealso: :meth:`__mul__` :meth:`DualQuaternion.__matmul__`
+        """
+        if isinstance(right, UnitDualQuaternion):
+            return UnitDualQuaternion._from_array(
+                _dqunit(_dqmul_broadcast(self._a, right._a))
+            )
+        return super().__matmul__(right)
+
+    def _Rt(self) -> tuple[np.ndarray, np.ndarray]:
+        # rotation matrices (...,3,3) and translation vectors (...,3), where
+        # the translation is the vector part of 2 q_d q_r*
+        a = self._a
+        qr = a[..., :4]
+        t = 2 * _qqmul(a[..., 4:], np.multiply(qr, _CONJ_MASK[:4], dtype=qr.dtype))
+        return _q2r(qr), t[..., 1:]
 
     def SE3(self) -> pose3d.SE3:
         """
@@ -350,10 +937,16 @@ class UnitDualQuaternion(DualQuaternion):
             >>> print(d)
             >>> print(d.T)
         """
-        R = base.q2r(self.real.A)
-        t = 2 * self.dual * self.real.conj()
-
-        return pose3d.SE3(base.rt2tr(R, t.v))
+        R, t = self._Rt()
+        T = np.zeros(R.shape[:-2] + (4, 4))
+        T[..., :3, :3] = R
+        T[..., :3, 3] = t
+        T[..., 3, 3] = 1
+
+        if T.ndim == 2:
+            return pose3d.SE3(T, check=False)
+        else:
+            return pose3d.SE3(list(T), check=False)
 
 
 if __name__ == "__main__":
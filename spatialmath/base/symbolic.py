@@ -1,10 +1,55 @@
+from __future__ import annotations
 import math
-from typing import Any, overload
-import sympy
-from sympy import Symbol
+import sys
+from typing import Any, overload, TYPE_CHECKING
+import numpy as np
+from spatialmath.base.types import NDArray
 
+if TYPE_CHECKING:  # pragma: no cover
+    from sympy import Symbol
 
-symtype = (sympy.Expr,)
+# SymPy is slow to import so it is only imported when a symbolic operation is
+# requested.  Until then nothing can be a SymPy object, so type tests against
+# symtype do not need to import it.
+
+_sympy = None
+_sys_modules = sys.modules
+
+# symbolic constants, set when SymPy is imported
+_ZERO = _ONE = _NEGATIVE_ONE = _PI = None
+
+
+def _get_sympy():
+    # import SymPy on first use
+    global _sympy, _ZERO, _ONE, _NEGATIVE_ONE, _PI
+    if _sympy is None:
+        import sympy
+
+        _sympy = sympy
+        _ZERO, _ONE = sympy.S.Zero, sympy.S.One
+        _NEGATIVE_ONE, _PI = sympy.S.NegativeOne, sympy.S.Pi
+    return _sympy
+
+
+class _SymTypeMeta(type):
+    def __instancecheck__(cls, obj: Any) -> bool:
+        sympy = _sys_modules.get("sympy")
+        return sympy is not None and isinstance(obj, sympy.Expr)
+
+
+class _SymType(metaclass=_SymTypeMeta):
+    # stands in for sympy.Expr in isinstance tests without importing SymPy
+    pass
+
+
+symtype = (_SymType,)
+
+# bound once so the generalized functions below avoid repeated module
+# attribute lookups
+_number = (float, int)
+_ndarray = np.ndarray
+_msin, _mcos, _mtan, _msqrt = math.sin, math.cos, math.tan, math.sqrt
+_nsin, _ncos, _ntan, _nsqrt = np.sin, np.cos, np.tan, np.sqrt
 
 # ---------------------------------------------------------------------------------------#
 
@@ -25,8 +70,12 @@ def issymbol(var: Any) -> bool:
         >>> issymbol(3.4)
 
     """
-    if isinstance(var, (list, tuple)):
-        return any([isinstance(x, symtype) for x in var])
+    t = type(var)
+    if t is float or t is int:
+        # common numeric case
+        return False
+    elif isinstance(var, (list, tuple)):
+        return any(isinstance(x, symtype) for x in var)
     else:
         return isinstance(var, symtype)
 
@@ -39,14 +88,18 @@ def sin(theta: float) -> float: ...
 def sin(theta: Symbol) -> Symbol: ...
 
 
-def sin(theta: float | Symbol) -> float | Symbol:
+@overload
+def sin(theta: NDArray) -> NDArray: ...
+
+
+def sin(theta: float | Symbol | NDArray) -> float | Symbol | NDArray:
     """
     Generalized sine function
 
     :param θ: argument
-    :type θ: float or symbolic
+    :type θ: float, symbolic or ndarray
     :return: sin(θ)
-    :rtype: float or symbolic
+    :rtype: float, symbolic or ndarray
 
     .. runblock:: pycon
 
@@ -54,13 +107,19 @@ def sin(theta: float | Symbol) -> float | Symbol:
         >>> theta = symbol('theta')
         >>> sin(theta)
         >>> sin(0.5)
+        >>> sin(np.r_[0.5, 1])
+
+    An ndarray argument is evaluated element-wise by :func:`numpy.sin`.
 
     :seealso: :func:`sympy.sin`
     """
-    if issymbol(theta):
-        return sympy.sin(theta)  # type: ignore
-    else:
-        return math.sin(theta)
+    if isinstance(theta, _number):
+        return _msin(theta)
+    elif isinstance(theta, _ndarray):
+        return _nsin(theta)
+    elif isinstance(theta, _SymType):
+        return _get_sympy().sin(theta)  # type: ignore
+    return _msin(theta)
 
 
 @overload
@@ -71,14 +130,18 @@ def cos(theta: float) -> float: ...
 def cos(theta: Symbol) -> Symbol: ...
 
 
-def cos(theta: float | Symbol) -> float | Symbol:
+@overload
+def cos(theta: NDArray) -> NDArray: ...
+
+
+def cos(theta: float | Symbol | NDArray) -> float | Symbol | NDArray:
     """
     Generalized cosine function
 
     :param θ: argument
-    :type θ: float or symbolic
+    :type θ: float, symbolic or ndarray
     :return: cos(θ)
-    :rtype: float or symbolic
+    :rtype: float, symbolic or ndarray
 
     .. runblock:: pycon
 
@@ -86,13 +149,19 @@ def cos(theta: float | Symbol) -> float | Symbol:
         >>> theta = symbol('theta')
         >>> cos(theta)
         >>> cos(0.5)
+        >>> cos(np.r_[0.5, 1])
+
+    An ndarray argument is evaluated element-wise by :func:`numpy.cos`.
 
     :seealso: :func:`sympy.cos`
     """
-    if issymbol(theta):
-        return sympy.cos(theta)  # type: ignore
-    else:
-        return math.cos(theta)
+    if isinstance(theta, _number):
+        return _mcos(theta)
+    elif isinstance(theta, _ndarray):
+        return _ncos(theta)
+    elif isinstance(theta, _SymType):
+        return _get_sympy().cos(theta)  # type: ignore
+    return _mcos(theta)
 
 
 @overload
@@ -103,14 +172,18 @@ def tan(theta: float) -> float: ...
 def tan(theta: Symbol) -> Symbol: ...
 
 
-def tan(theta: float | Symbol) -> float | Symbol:
+@overload
+def tan(theta: NDArray) -> NDArray: ...
+
+
+def tan(theta: float | Symbol | NDArray) -> float | Symbol | NDArray:
     """
     Generalized tangent function
 
     :param θ: argument
-    :type θ: float or symbolic
+    :type θ: float, symbolic or ndarray
     :return: tan(θ)
-    :rtype: float or symbolic
+    :rtype: float, symbolic or ndarray
 
     .. runblock:: pycon
 
@@ -118,13 +191,19 @@ def tan(theta: float | Symbol) -> float | Symbol:
         >>> theta = symbol('theta')
         >>> tan(theta)
         >>> tan(0.5)
+        >>> tan(np.r_[0.5, 1])
+
+    An ndarray argument is evaluated element-wise by :func:`numpy.tan`.
 
     :seealso: :func:`sympy.tan`
     """
-    if issymbol(theta):
-        return sympy.tan(theta)  # type: ignore
-    else:
-        return math.tan(theta)
+    if isinstance(theta, _number):
+        return _mtan(theta)
+    elif isinstance(theta, _ndarray):
+        return _ntan(theta)
+    elif isinstance(theta, _SymType):
+        return _get_sympy().tan(theta)  # type: ignore
+    return _mtan(theta)
 
 
 @overload
@@ -135,14 +214,18 @@ def sqrt(theta: float) -> float: ...
 def sqrt(theta: Symbol) -> Symbol: ...
 
 
-def sqrt(theta: float | Symbol) -> float | Symbol:
+@overload
+def sqrt(theta: NDArray) -> NDArray: ...
+
+
+def sqrt(theta: float | Symbol | NDArray) -> float | Symbol | NDArray:
     """
     Generalized sqrt function
 
     :param v: argument
-    :type v: float or symbolic
+    :type v: float, symbolic or ndarray
     :return: √ v
-    :rtype: float or symbolic
+    :rtype: float, symbolic or ndarray
 
     .. runblock:: pycon
 
@@ -150,13 +233,19 @@ def sqrt(theta: float | Symbol) -> float | Symbol:
         >>> x = symbol('x')
         >>> sqrt(x ** 2)
         >>> sqrt(4)
+        >>> sqrt(np.r_[4, 9])
+
+    An ndarray argument is evaluated element-wise by :func:`numpy.sqrt`.
 
     :seealso: :func:`sympy.sqrt`
     """
-    if issymbol(theta):
-        return sympy.sqrt(theta)  # type: ignore
-    else:
-        return math.sqrt(theta)
+    if isinstance(theta, _number):
+        return _msqrt(theta)
+    elif isinstance(theta, _ndarray):
+        return _nsqrt(theta)
+    elif isinstance(theta, _SymType):
+        return _get_sympy().sqrt(theta)  # type: ignore
+    return _msqrt(theta)
 
 
 def zero() -> Symbol:
@@ -175,7 +264,9 @@ def zero() -> Symbol:
 
     :seealso: :func:`sympy.S.Zero`
     """
-    return sympy.S.Zero
+    if _sympy is None:
+        _get_sympy()
+    return _ZERO
 
 
 def one() -> Symbol:
@@ -194,7 +285,9 @@ def one() -> Symbol:
 
     :seealso: :func:`sympy.S.One`
     """
-    return sympy.S.One
+    if _sympy is None:
+        _get_sympy()
+    return _ONE
 
 
 def negative_one() -> Symbol:
@@ -213,7 +306,9 @@ def negative_one() -> Symbol:
 
     :seealso: :func:`sympy.S.NegativeOne`
     """
-    return sympy.S.NegativeOne
+    if _sympy is None:
+        _get_sympy()
+    return _NEGATIVE_ONE
 
 
 def pi() -> Symbol:
@@ -232,7 +327,9 @@ def pi() -> Symbol:
 
     :seealso: :func:`sympy.S.Pi`
     """
-    return sympy.S.Pi
+    if _sympy is None:
+        _get_sympy()
+    return _PI
 
 
 def simplify(x: Symbol) -> Symbol:
@@ -254,7 +351,7 @@ def simplify(x: Symbol) -> Symbol:
 
     :seealso: :func:`sympy.simplify`
     """
-    return sympy.simplify(x)
+    return _get_sympy().simplify(x)
 
 
 def det(x):
@@ -276,7 +373,20 @@ def det(x):
         >>> print(det(R))
         >>> simplify(print(det(R)))
 
-    .. note:: Converts to a SymPy ``Matrix`` and then back again.
+    .. note:: 2x2 and 3x3 determinants are expanded directly, by the
+        cofactor rule and the rule of Sarrus respectively.  Larger matrices
+        are converted to a SymPy ``Matrix``.
     """
-
-    return sympy.Matrix(x).det()
+    x = np.asarray(x)
+    if x.shape == (2, 2):
+        return x[0, 0] * x[1, 1] - x[0, 1] * x[1, 0]
+    elif x.shape == (3, 3):
+        return (
+            x[0, 0] * x[1, 1] * x[2, 2]
+            + x[0, 1] * x[1, 2] * x[2, 0]
+            + x[0, 2] * x[1, 0] * x[2, 1]
+            - x[0, 2] * x[1, 1] * x[2, 0]
+            - x[0, 0] * x[1, 2] * x[2, 1]
+            - x[0, 1] * x[1, 0] * x[2, 2]
+        )
+    return _get_sympy().Matrix(x).det()
@@ -24,7 +24,6 @@ from spatialmath.base.types import (
 )
 from spatialmath.base.transformsNd import rt2tr
 from spatialmath.base.vectors import unitvec
-import sympy
 from typing import overload, Any, cast, TextIO
 
 _eps = np.finfo(np.float64).eps
@@ -152,6 +151,8 @@ def tr2xyt(T: SE2Array, unit: str = "rad") -> R3:
     """
 
     if T.dtype == "O":
+        import sympy
+
         angle = sympy.atan2(T[1, 0], T[0, 0])
     else:
         angle = math.atan2(T[1, 0], T[0, 0])
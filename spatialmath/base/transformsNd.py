@@ -22,7 +22,6 @@ from spatialmath.base.argcheck import getvector, isvector
 
 from typing import overload
 
-from sympy import Matrix
 
 _eps = np.finfo(np.float64).eps
 
@@ -821,6 +820,8 @@ def det(m: np.ndarray) -> float:
     :SymPy: supported
     """
     if m.dtype.kind == "O":
+        from sympy import Matrix
+
         return Matrix(m).det()
     else:
         return np.linalg.det(m)
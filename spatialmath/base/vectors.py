@@ -2,6 +2,7 @@ import math
 from typing import overload
 import numpy as np
 from spatialmath.base.argcheck import getvector
+import spatialmath.base.symbolic as sym
 from spatialmath.base.types import (
     ArrayLikePure,
     ArrayLike3,
@@ -12,15 +13,6 @@ from spatialmath.base.types import (
     R6,
 )
 
-try:  # pragma: no cover
-    # print('Using SymPy')
-    import sympy
-
-    _symbolics = True
-
-except ImportError:  # pragma: no cover
-    _symbolics = False
-
 _eps = np.finfo(np.float64).eps
 
 
@@ -51,8 +43,8 @@ def norm(v: ArrayLikePure) -> float:
     for x in v:
         sum += x * x
 
-    if _symbolics and isinstance(sum, sympy.Expr):
-        return sympy.sqrt(sum)
+    if isinstance(sum, sym.symtype):
+        return sym.sqrt(sum)
     else:
         return math.sqrt(sum)
 
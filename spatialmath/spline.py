@@ -6,7 +6,7 @@ Classes for parameterizing a trajectory in SE3 with splines.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -127,12 +127,29 @@ class InterpSplineSE3(SplineSE3):
             Rotation.from_matrix(np.array([(pose.R) for pose in self.control_poses])),
         )
 
-    def __call__(self, t: float) -> SE3:
+    def __call__(self, t: Union[float, List[float], np.ndarray]) -> SE3:
         """Compute function value at t.
+
+        If t is a list or array of N times the spline is evaluated at all of them
+        at once.
+
         Return:
-            pose: SE3
+            pose: SE3, with N values if t is a list or array
+
+        Raises:
+            ValueError: if t is an empty list or array
         """
-        return SE3.Rt(t=self.spline_xyz(t), R=self.spline_so3(t).as_matrix())
+        if np.ndim(t) == 0:
+            return SE3.Rt(t=self.spline_xyz(t), R=self.spline_so3(t).as_matrix())
+
+        t = np.asarray(t)
+        if len(t) == 0:
+            raise ValueError("Need at least one time to evaluate the spline.")
+        T = np.zeros((len(t), 4, 4))
+        T[:, :3, :3] = self.spline_so3(t).as_matrix()
+        T[:, :3, 3] = self.spline_xyz(t)
+        T[:, 3, 3] = 1
+        return SE3(list(T), check=False)
 
     def derivative(self, t: float) -> Twist3:
         linear_vel = self.spline_xyz.derivative()(t)
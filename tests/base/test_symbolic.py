@@ -1,13 +1,19 @@
 import unittest
 import math
+import subprocess
+import sys
+import numpy as np
+import numpy.testing as nt
 import sympy as sp
 
 # from spatialmath.base.symbolic import *
 from spatialmath.base.symbolic import (
     sin,
     cos,
+    tan,
     sqrt,
     simplify,
+    det,
     zero,
     one,
     negative_one,
@@ -47,6 +53,18 @@ class Test_symbolic(unittest.TestCase):
         self.assertFalse(issymbol([1, 2]))
         self.assertTrue(issymbol(theta))
 
+    def test_lazy_import(self):
+        # numeric use of spatialmath must not import SymPy
+        code = (
+            "import sys; import spatialmath; import spatialmath.base as base; "
+            "base.rotx(0.3); "
+            "assert 'sympy' not in sys.modules, 'sympy was imported'"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
     def test_functions(self):
         theta = sp.symbols("theta", real=True)
         self.assertTrue(isinstance(sin(theta), sp.Expr))
@@ -61,6 +79,35 @@ class Test_symbolic(unittest.TestCase):
         x = (theta - 1) * (theta + 1) - theta**2
         self.assertTrue(math.isclose(simplify(x).evalf(), -1))
 
+        # SymPy memoizes function application, so repeated sin/cos of the same
+        # angle share one node in expression trees
+        self.assertIs(sin(theta), sin(theta))
+        self.assertIs(cos(theta), cos(theta))
+
+    def test_functions_array(self):
+        x = np.r_[0.1, 0.5, 2.0]
+        nt.assert_array_almost_equal(sin(x), np.sin(x))
+        nt.assert_array_almost_equal(cos(x), np.cos(x))
+        nt.assert_array_almost_equal(tan(x), np.tan(x))
+        nt.assert_array_almost_equal(sqrt(x), np.sqrt(x))
+
+    def test_det(self):
+        theta = sp.symbols("theta", real=True)
+        c, s = cos(theta), sin(theta)
+
+        R = np.array([[c, -s], [s, c]])
+        self.assertEqual(simplify(det(R)), 1)
+
+        R = np.array([[1, 0, 0], [0, c, -s], [0, s, c]])
+        self.assertEqual(simplify(det(R)), 1)
+
+        M = np.array(sp.symbols("a:9")).reshape((3, 3))
+        self.assertEqual(sp.expand(det(M) - sp.Matrix(M).det()), 0)
+
+        T = np.eye(4, dtype=object)
+        T[:3, :3] = R
+        self.assertEqual(simplify(det(T)), 1)
+
     def test_constants(self):
         x = zero()
         self.assertTrue(isinstance(x, sp.Expr))
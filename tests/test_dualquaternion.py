@@ -1,10 +1,23 @@
+import importlib
+import math
 from math import pi
+import sys
 import numpy as np
 
 import numpy.testing as nt
 import unittest
+from unittest import mock
 
-from spatialmath import DualQuaternion, UnitDualQuaternion, Quaternion, SE3
+from spatialmath import (
+    DualQuaternion,
+    UnitDualQuaternion,
+    Quaternion,
+    UnitQuaternion,
+    SE3,
+)
+
+# the module, the package attribute of the same name is the class
+dqmodule = importlib.import_module("spatialmath.DualQuaternion")
 
 
 class TestDualQuaternion(unittest.TestCase):
@@ -17,6 +30,72 @@ class TestDualQuaternion(unittest.TestCase):
         dq = DualQuaternion(np.r_[1, 2, 3, 4, 5, 6, 7, 8])
         nt.assert_array_almost_equal(dq.vec, np.r_[1, 2, 3, 4, 5, 6, 7, 8])
 
+    def test_multiple(self):
+        A = np.arange(24.0).reshape((3, 8))
+        dq = DualQuaternion(A)
+        self.assertEqual(len(dq), 3)
+        nt.assert_array_almost_equal(dq.vec, A)
+        nt.assert_array_almost_equal(dq[1].vec, A[1])
+        self.assertEqual(len(dq.real), 3)
+        nt.assert_array_almost_equal(dq.real.vec, A[:, :4])
+        nt.assert_array_almost_equal(dq.dual.vec, A[:, 4:])
+
+        with self.assertRaises(ValueError):
+            DualQuaternion(np.zeros((2, 3, 8)))
+
+        s = dq + dq
+        nt.assert_array_almost_equal(s.vec, 2 * A)
+
+        p = dq * dq
+        for i in range(3):
+            nt.assert_array_almost_equal(p[i].vec, (dq[i] * dq[i]).vec)
+
+    def test_getitem(self):
+        A = np.arange(24.0).reshape((3, 8))
+        dq = DualQuaternion(A)
+        self.assertEqual(len(dq[1:]), 2)
+        nt.assert_array_almost_equal(dq[1:].vec, A[1:])
+
+        d = dq[1]
+        d.vec[0] = -1
+        self.assertEqual(dq.vec[1, 0], A[1, 0])
+
+        # single value
+        dq = DualQuaternion(A[0])
+        for d in (dq[0], dq[-1], dq[:]):
+            self.assertIsNot(d, dq)
+            self.assertEqual(len(d), 1)
+            nt.assert_array_almost_equal(d.vec, A[0])
+        self.assertEqual(len(dq[1:]), 0)
+        with self.assertRaises(IndexError):
+            dq[1]
+
+        d = dq[0]
+        d.vec[0] = -1
+        self.assertEqual(dq.vec[0], A[0, 0])
+
+        self.assertIsInstance(UnitDualQuaternion()[0], UnitDualQuaternion)
+
+    def test_dtype(self):
+        A = np.arange(16.0).reshape((2, 8))
+        dq = DualQuaternion(A, dtype=np.float32)
+        self.assertEqual(dq.vec.dtype, np.float32)
+        self.assertEqual((dq + dq).vec.dtype, np.float32)
+        self.assertEqual((dq * dq).vec.dtype, np.float32)
+        self.assertEqual(dq.conj().vec.dtype, np.float32)
+        self.assertEqual(dq.matrix().dtype, np.float32)
+        nt.assert_array_almost_equal(
+            dq.conj().vec, DualQuaternion(A).conj().vec, decimal=5
+        )
+        nt.assert_array_almost_equal(
+            (dq * dq).vec, (DualQuaternion(A) * DualQuaternion(A)).vec, decimal=3
+        )
+
+        with self.assertRaises(ValueError):
+            DualQuaternion(A, dtype=np.int32)
+        with self.assertRaises(ValueError):
+            DualQuaternion(dtype=np.int32)
+
     def test_pure(self):
         dq = DualQuaternion.Pure([1.0, 2, 3])
         nt.assert_array_almost_equal(dq.vec, np.r_[1, 0, 0, 0, 0, 1, 2, 3])
@@ -47,6 +126,28 @@ class TestDualQuaternion(unittest.TestCase):
         self.assertIsInstance(M, np.ndarray)
         self.assertEqual(M.shape, (8, 8))
 
+        dq = DualQuaternion(np.stack((dq1.vec, 2 * dq1.vec)))
+        M = dq.matrix()
+        self.assertEqual(M.shape, (2, 8, 8))
+        nt.assert_array_almost_equal(M[1], 2 * dq1.matrix())
+
+    def test_norm(self):
+        dq = DualQuaternion(Quaternion([1.0, 2, 3, 4]), Quaternion([5.0, 6, 7, 8]))
+        n = dq.norm()
+        nt.assert_array_almost_equal(n, (math.sqrt(30), 70 / math.sqrt(30)))
+
+        # dual number square root of q q*
+        qq = (dq * dq.conj()).vec
+        self.assertAlmostEqual(n[0] ** 2, qq[0])
+        self.assertAlmostEqual(2 * n[0] * n[1], qq[4])
+
+        self.assertEqual(DualQuaternion().norm(), (0, 0))
+
+        dq = DualQuaternion(np.vstack((dq.vec, np.zeros(8))))
+        n = dq.norm()
+        nt.assert_array_almost_equal(n[0], (math.sqrt(30), 0))
+        nt.assert_array_almost_equal(n[1], (70 / math.sqrt(30), 0))
+
     def test_multiply(self):
         dq1 = DualQuaternion(Quaternion([1.0, 2, 3, 4]), Quaternion([5.0, 6, 7, 8]))
         dq2 = DualQuaternion(Quaternion([4, 3, 2, 1]), Quaternion([5, 6, 7, 8]))
@@ -55,6 +156,88 @@ class TestDualQuaternion(unittest.TestCase):
         v = dq2.vec
         nt.assert_array_almost_equal(M @ v, (dq1 * dq2).vec)
 
+    def test_matmul(self):
+        A = np.arange(40.0).reshape(5, 8) - 20
+        B = np.arange(40.0).reshape(5, 8)[::-1]
+        dqa = DualQuaternion(A)
+        dqb = DualQuaternion(B)
+
+        d = dqa @ dqb
+        self.assertEqual(len(d), 5)
+        for i in range(5):
+            nt.assert_array_almost_equal(d[i].vec, (dqa[i] * dqb[i]).vec)
+
+        d = dqa @ dqb[2]
+        self.assertEqual(len(d), 5)
+        for i in range(5):
+            nt.assert_array_almost_equal(d[i].vec, (dqa[i] * dqb[2]).vec)
+
+        d = dqa[1] @ dqb
+        self.assertEqual(len(d), 5)
+        for i in range(5):
+            nt.assert_array_almost_equal(d[i].vec, (dqa[1] * dqb[i]).vec)
+
+        d = dqa[0] @ dqb[0]
+        self.assertEqual(len(d), 1)
+        nt.assert_array_almost_equal(d.vec, (dqa[0] * dqb[0]).vec)
+
+        with self.assertRaises(ValueError):
+            dqa @ Quaternion([1, 2, 3, 4])
+
+    def test_multiply_kernels(self):
+        rng = np.random.default_rng(0)
+        N = dqmodule._DQMUL_SOA_MIN
+        A = rng.uniform(-1, 1, (N, 8))
+        B = rng.uniform(-1, 1, (N, 8))
+        # product computed from the 8x8 product matrices
+        ref = np.einsum("nij,nj->ni", DualQuaternion(A).matrix(), B)
+
+        for dtype, decimal in ((np.float64, 10), (np.float32, 5)):
+            a, b = A.astype(dtype), B.astype(dtype)
+
+            p = dqmodule._dqmul_soa(a, b)
+            self.assertEqual(p.dtype, dtype)
+            self.assertTrue(p.flags.c_contiguous)
+            nt.assert_array_almost_equal(p, ref, decimal=decimal)
+
+            # the Numba kernel run as plain Python
+            p = np.empty_like(a[:20])
+            dqmodule._dqmul_batch(a[:20], b[:20], p)
+            nt.assert_array_almost_equal(p, ref[:20], decimal=decimal)
+
+            # fallbacks without Numba, component-wise at N and above, einsum
+            # below
+            with (
+                mock.patch.object(dqmodule, "_numba", False),
+                mock.patch.object(
+                    dqmodule, "_dqmul_soa", wraps=dqmodule._dqmul_soa
+                ) as soa,
+            ):
+                for n in (N, N - 1):
+                    p = DualQuaternion(a[:n], dtype=dtype) * DualQuaternion(
+                        b[:n], dtype=dtype
+                    )
+                    self.assertEqual(p.vec.dtype, dtype)
+                    nt.assert_array_almost_equal(p.vec, ref[:n], decimal=decimal)
+                self.assertEqual(soa.call_count, 1)
+
+            p = DualQuaternion(a, dtype=dtype) * DualQuaternion(b, dtype=dtype)
+            self.assertEqual(p.vec.dtype, dtype)
+            nt.assert_array_almost_equal(p.vec, ref, decimal=decimal)
+
+    def test_numba_import_error(self):
+        # numba is installed but fails to import
+        A = np.arange(24.0).reshape((3, 8))
+        ref = np.einsum("nij,nj->ni", DualQuaternion(A).matrix(), A[::-1])
+        with (
+            mock.patch.dict(sys.modules, {"numba": None}),
+            mock.patch.object(dqmodule, "_numba", True),
+            mock.patch.object(dqmodule, "_dqmul_batch_jit", None),
+        ):
+            p = DualQuaternion(A) * DualQuaternion(A[::-1])
+            self.assertFalse(dqmodule._numba)
+            nt.assert_array_almost_equal(p.vec, ref)
+
     def test_unit(self):
         pass
 
@@ -65,11 +248,85 @@ class TestUnitDualQuaternion(unittest.TestCase):
         dq = UnitDualQuaternion(T)
         nt.assert_array_almost_equal(dq.SE3().A, T.A)
 
+    def test_real(self):
+        T = SE3.Rx(0.3)
+        dq = UnitDualQuaternion(T)
+        self.assertIsInstance(dq.real, UnitQuaternion)
+        self.assertIsInstance((dq * dq).real, UnitQuaternion)
+        nt.assert_array_almost_equal(dq.real.R, T.R)
+        self.assertNotIsInstance(dq.dual, UnitQuaternion)
+
+        T = SE3.Rand(N=3)
+        dq = UnitDualQuaternion(T)
+        self.assertIsInstance(dq.real, UnitQuaternion)
+        self.assertEqual(len(dq.real), 3)
+        nt.assert_array_almost_equal(dq.real[2].R, T[2].R)
+
+    def test_FromSE3(self):
+        T = SE3.Rand(N=10)
+        T.append(SE3.Ry(pi))
+        T.append(SE3())
+
+        dq = UnitDualQuaternion.FromSE3(T)
+        self.assertIsInstance(dq, UnitDualQuaternion)
+        self.assertEqual(len(dq), len(T))
+        for d, t in zip(dq, T):
+            nt.assert_array_almost_equal(d.vec, UnitDualQuaternion(t).vec)
+
+        dq = UnitDualQuaternion.FromSE3(np.array(T.A))
+        nt.assert_array_almost_equal(dq.vec, UnitDualQuaternion(T).vec)
+
+        dq = UnitDualQuaternion.FromSE3(T[0].A)
+        self.assertEqual(len(dq), 1)
+        nt.assert_array_almost_equal(dq.SE3().A, T[0].A)
+
+        dq = UnitDualQuaternion.FromSE3(T, dtype=np.float32)
+        self.assertEqual(dq.vec.dtype, np.float32)
+        nt.assert_array_almost_equal(dq.SE3()[3].A, T[3].A, decimal=5)
+
+    def test_dtype(self):
+        T = SE3.Rand(N=4)
+        for d in (
+            UnitDualQuaternion(dtype=np.float32),
+            UnitDualQuaternion(T[0], dtype=np.float32),
+            UnitDualQuaternion(T, dtype=np.float32),
+            UnitDualQuaternion.FromSE3(T, dtype=np.float32),
+        ):
+            self.assertIsInstance(d, UnitDualQuaternion)
+            self.assertEqual(d.vec.dtype, np.float32)
+            self.assertEqual(d.conj().vec.dtype, np.float32)
+            self.assertEqual((d * d).vec.dtype, np.float32)
+
+        # point transforms keep the dtype
+        d = UnitDualQuaternion(T, dtype=np.float32)
+        p = d * [1, 2, 3]
+        self.assertEqual(p.dtype, np.float32)
+        nt.assert_array_almost_equal(p, T * [1, 2, 3], decimal=5)
+        P = np.array([[1.0, 2, 3], [4, 5, 6]]).T
+        p = d[0] * P
+        self.assertEqual(p.dtype, np.float32)
+        nt.assert_array_almost_equal(p, T[0] * P, decimal=5)
+
+        for dtype in (np.int32, np.float16, object):
+            with self.assertRaises(ValueError):
+                UnitDualQuaternion(dtype=dtype)
+            with self.assertRaises(ValueError):
+                UnitDualQuaternion(T[0], dtype=dtype)
+            with self.assertRaises(ValueError):
+                UnitDualQuaternion(T, dtype=dtype)
+            with self.assertRaises(ValueError):
+                UnitDualQuaternion.FromSE3(T, dtype=dtype)
+
     def test_norm(self):
         T = SE3.Rx(pi / 4)
         dq = UnitDualQuaternion(T)
         nt.assert_array_almost_equal(dq.norm(), (1, 0))
 
+        dq = UnitDualQuaternion(SE3.Rand(N=5))
+        n = dq.norm()
+        nt.assert_array_almost_equal(n[0], np.ones(5))
+        nt.assert_array_almost_equal(n[1], np.zeros(5))
+
     def test_multiply(self):
         T1 = SE3.Rx(pi / 4)
         T2 = SE3.Rz(-pi / 3)
@@ -80,8 +337,56 @@ class TestUnitDualQuaternion(unittest.TestCase):
         d2 = UnitDualQuaternion(T2)
 
         d = d1 * d2
+        self.assertIsInstance(d, UnitDualQuaternion)
         nt.assert_array_almost_equal(d.SE3().A, T.A)
 
+        dq = DualQuaternion(Quaternion([1.0, 2, 3, 4]), Quaternion([5.0, 6, 7, 8]))
+        self.assertNotIsInstance(d1 * dq, UnitDualQuaternion)
+        self.assertNotIsInstance(dq * d1, UnitDualQuaternion)
+
+    def test_matmul(self):
+        T1 = SE3.Rand(N=6)
+        T2 = SE3.Rand()
+        d1 = UnitDualQuaternion(T1)
+        d2 = UnitDualQuaternion(T2)
+
+        d = d1 @ d2
+        self.assertIsInstance(d, UnitDualQuaternion)
+        self.assertEqual(len(d), 6)
+        nt.assert_array_almost_equal(d.SE3().A, (T1 * T2).A)
+
+        # product is renormalized
+        d = UnitDualQuaternion(d2.vec * 1.1)
+        d = d @ d
+        nt.assert_array_almost_equal(d.norm(), (1, 0))
+        self.assertAlmostEqual(np.linalg.norm(d.vec[:4]), 1)
+        self.assertAlmostEqual(np.dot(d.vec[:4], d.vec[4:]), 0)
+
+        dq = DualQuaternion(Quaternion([1.0, 2, 3, 4]), Quaternion([5.0, 6, 7, 8]))
+        self.assertNotIsInstance(d1 @ dq, UnitDualQuaternion)
+
+    def test_transform(self):
+        T = SE3.Rx(0.3) * SE3.Trans(1, 2, 3)
+        dq = UnitDualQuaternion(T)
+
+        p = dq * [1, 2, 3]
+        self.assertEqual(p.shape, (3,))
+        nt.assert_array_almost_equal(p, (T * [1, 2, 3]).ravel())
+
+        P = np.array([[1.0, 2, 3], [4, 5, 6], [0, 0, 0], [-1, 2, 0]]).T
+        nt.assert_array_almost_equal(dq * P, T * P)
+
+        # a single column point keeps its shape, as for SE3
+        p = dq * np.c_[[1, 2, 3]]
+        self.assertEqual(p.shape, (3, 1))
+        nt.assert_array_almost_equal(p, T * np.c_[[1, 2, 3]])
+
+        T = SE3.Rand(N=4)
+        dq = UnitDualQuaternion(T)
+        nt.assert_array_almost_equal(dq * [1, 2, 3], T * [1, 2, 3])
+        nt.assert_array_almost_equal(dq * np.c_[[1, 2, 3]], T * np.c_[[1, 2, 3]])
+        nt.assert_array_almost_equal(np.array(dq.SE3().A), np.array(T.A))
+
 
 # ---------------------------------------------------------------------------------------#
 if __name__ == "__main__":  # pragma: no cover
@@ -1,49 +1,64 @@
 import numpy.testing as nt
 import numpy as np
+import pytest
 import unittest
 
-from spatialmath import BSplineSE3, SE3, InterpSplineSE3, SplineFit, SO3
+from spatialmath import BSplineSE3, SE3, InterpSplineSE3, SplineFit
+
+
+def _waypoints(n=8):
+    # poses on a circle, rotating about y
+    e = np.arange(n)
+    c = 2 * np.cos(e / 2 * np.pi)
+    s = 2 * np.sin(e / 2 * np.pi)
+    return [SE3.Trans([x, y, z]) * SE3.Ry(x / 8 * np.pi) for x, y, z in zip(e, c, s)]
 
 
 class TestBSplineSE3(unittest.TestCase):
-    control_poses = [
-        SE3.Trans([e, 2 * np.cos(e / 2 * np.pi), 2 * np.sin(e / 2 * np.pi)])
-        * SE3.Ry(e / 8 * np.pi)
-        for e in range(0, 8)
-    ]
+    @classmethod
+    def setUpClass(cls):
+        cls.control_poses = _waypoints()
+        cls.spline = BSplineSE3(cls.control_poses)
 
     def test_constructor(self):
-        BSplineSE3(self.control_poses)
+        self.assertIsInstance(self.spline, BSplineSE3)
 
     def test_evaluation(self):
-        spline = BSplineSE3(self.control_poses)
+        spline = self.spline
         nt.assert_almost_equal(spline(0).A, self.control_poses[0].A)
         nt.assert_almost_equal(spline(1).A, self.control_poses[-1].A)
 
 
 class TestInterpSplineSE3:
-    waypoints = [
-        SE3.Trans([e, 2 * np.cos(e / 2 * np.pi), 2 * np.sin(e / 2 * np.pi)])
-        * SE3.Ry(e / 8 * np.pi)
-        for e in range(0, 8)
-    ]
     time_horizon = 10
-    times = np.linspace(0, time_horizon, len(waypoints))
+
+    @classmethod
+    def setup_class(cls):
+        cls.waypoints = _waypoints()
+        cls.times = np.linspace(0, cls.time_horizon, len(cls.waypoints))
+        cls.spline = InterpSplineSE3(cls.times, cls.waypoints)
 
     def test_constructor(self):
-        InterpSplineSE3(self.times, self.waypoints)
+        assert isinstance(self.spline, InterpSplineSE3)
 
     def test_evaluation(self):
-        spline = InterpSplineSE3(self.times, self.waypoints)
-        for time, pose in zip(self.times, self.waypoints):
-            nt.assert_almost_equal(spline(time).angdist(pose), 0.0)
-            nt.assert_almost_equal(np.linalg.norm(spline(time).t - pose.t), 0.0)
+        waypoints = SE3(self.waypoints)
+
+        spline = self.spline
+        nt.assert_almost_equal(spline(self.times[3]).A, self.waypoints[3].A)
+
+        poses = spline(self.times)
+        assert len(poses) == len(self.waypoints)
+        nt.assert_almost_equal(poses.angdist(waypoints), 0.0)
+        nt.assert_almost_equal(np.linalg.norm(poses.t - waypoints.t, axis=-1), 0.0)
 
         spline = InterpSplineSE3(self.times, self.waypoints, normalize_time=True)
-        norm_time = spline.timepoints
-        for time, pose in zip(norm_time, self.waypoints):
-            nt.assert_almost_equal(spline(time).angdist(pose), 0.0)
-            nt.assert_almost_equal(np.linalg.norm(spline(time).t - pose.t), 0.0)
+        poses = spline(spline.timepoints)
+        nt.assert_almost_equal(poses.angdist(waypoints), 0.0)
+        nt.assert_almost_equal(np.linalg.norm(poses.t - waypoints.t, axis=-1), 0.0)
+
+        with pytest.raises(ValueError):
+            spline([])
 
     def test_small_delta_t(self):
         InterpSplineSE3(
@@ -56,19 +71,24 @@ class TestSplineFit:
     time_horizon = 5
     num_viz_points = 100
 
-    # make a helix
-    timestamps = np.linspace(0, 1, num_data_points)
-    trajectory = [
-        SE3.Rt(
-            t=[
-                t * 0.4,
-                0.4 * np.sin(t * 2 * np.pi * 0.5),
-                0.4 * np.cos(t * 2 * np.pi * 0.5),
-            ],
-            R=SO3.Rx(t * 2 * np.pi * 0.5),
-        )
-        for t in timestamps * time_horizon
-    ]
+    @classmethod
+    def setup_class(cls):
+        # make a helix
+        cls.timestamps = np.linspace(0, 1, cls.num_data_points)
+        t = cls.timestamps * cls.time_horizon
+        c = np.cos(t * np.pi)
+        s = np.sin(t * np.pi)
+
+        T = np.tile(np.eye(4), (cls.num_data_points, 1, 1))
+        T[:, 1, 1] = c
+        T[:, 1, 2] = -s
+        T[:, 2, 1] = s
+        T[:, 2, 2] = c
+        T[:, 0, 3] = t * 0.4
+        T[:, 1, 3] = 0.4 * s
+        T[:, 2, 3] = 0.4 * c
+        # an (N,4,4) array is not split into values, pass a list of matrices
+        cls.trajectory = SE3(list(T), check=False)
 
     def test_spline_fit(self):
         fit = SplineFit(self.timestamps, self.trajectory)